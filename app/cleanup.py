@@ -0,0 +1,37 @@
+"""Orphan sweep CLI: ``python -m app.cleanup``.
+
+Removes stale uploads, unreferenced blobs, leftover links, and folders of
+cases that no longer exist:
+
+    python -m app.cleanup --dry-run
+    python -m app.cleanup --grace 0
+"""
+
+import argparse
+import logging
+
+from app.services.cleanup import sweep_orphans
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove orphaned files from storage")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would go")
+    parser.add_argument("--grace", type=float, help="skip files younger than this (seconds)")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+    )
+    removed = sweep_orphans(args.grace, dry_run=args.dry_run)
+    logger.info(
+        "%s: %s",
+        "Dry run" if args.dry_run else "Cleanup done",
+        ", ".join(f"{count} {kind}" for kind, count in removed.items()),
+    )
+
+
+if __name__ == "__main__":
+    main()
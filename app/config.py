@@ -17,6 +17,55 @@ class Settings(BaseSettings):
     google_api_key: str = ""
     openai_api_key: str = ""
 
+    # Optional override, e.g. a local fake provider for load testing
+    llm_base_url: str = ""
+
+    # LLM rate limiting — shared by every API/worker process via a SQLite file
+    llm_requests_per_minute: int = 60
+    llm_tokens_per_minute: int = 200_000
+    llm_max_concurrency: int = 4
+    llm_max_retries: int = 5
+    llm_backoff_base_seconds: float = 1.0
+    llm_backoff_max_seconds: float = 60.0
+    llm_limiter_db: Path = Path("llm_limiter.db")
+    # Per-request client timeout, and total budget per call including queueing
+    # and retries; drafts are generated inside an HTTP request so get less
+    llm_request_timeout_seconds: float = 120.0
+    llm_total_timeout_seconds: float = 600.0
+    llm_draft_timeout_seconds: float = 90.0
+
+    # Process profile — "inline" runs the pipeline inside the API process;
+    # "worker" leaves uploads pending for `python -m app.worker`
+    process_mode: str = "inline"
+    worker_poll_interval_seconds: float = 2.0
+    # Work claimed longer ago than this is assumed abandoned by a crashed worker
+    worker_stale_after_seconds: int = 1800
+
+    # Create tables on API/worker startup (disable when running `python -m app.migrate`
+    # as a separate migration step)
+    create_schema_on_startup: bool = True
+
+    # Bulk re-classification — documents per checkpoint, parallel LLM calls
+    reclassify_batch_size: int = 50
+    reclassify_workers: int = 4
+
+    # Organizer — case/category views link to content-addressed blobs
+    # via "hardlink" (default) or "symlink"
+    organizer_link_mode: str = "hardlink"
+
+    # Native PDF text extraction — "pdfplumber" (layout-aware) or "pdfium" (fast).
+    # PDFs with at least pdf_parallel_min_pages pages are split across
+    # pdf_extract_workers processes.
+    pdf_text_engine: str = "pdfplumber"
+    pdf_extract_workers: int = 1
+    pdf_parallel_min_pages: int = 40
+
+    # Orphan sweep (`python -m app.cleanup`) ignores files younger than this
+    cleanup_grace_seconds: int = 3600
+
+    # Classify from the first N pages, then finish extraction in the background
+    classify_preview_pages: int = 3
+
     # Upload constraints
     max_upload_size_mb: int = 50
     supported_extensions: list[str] = [
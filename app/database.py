@@ -1,19 +1,42 @@
-from sqlalchemy import create_engine
+import logging
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 engine = create_engine(
     settings.database_url,
     connect_args={"check_same_thread": False},
 )
 SessionLocal = sessionmaker(bind=engine)
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, _record):
+        # SQLite ignores ON DELETE CASCADE unless enabled per connection
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 
 class Base(DeclarativeBase):
     pass
 
 
+def init_db():
+    """Create missing tables and columns. Run at startup or via ``python -m app.migrate``."""
+    import app.models  # noqa: F401 — registers tables on Base.metadata
+    from app.migrate import add_missing_columns
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for name in add_missing_columns(conn):
+            logger.info("Added column %s", name)
+
+
 def get_db():
     db = SessionLocal()
     try:
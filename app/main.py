@@ -1,6 +1,7 @@
 """FastAPI application entry point."""
 
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -8,24 +9,32 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import settings
-from app.database import Base, engine
-from app.routers import cases, documents
+from app.database import init_db
+from app.routers import admin, cases, documents
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
 )
 
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    if settings.create_schema_on_startup:
+        init_db()
+    yield
+
 
 app = FastAPI(
     title=settings.app_name,
     version="0.1.0",
     description="Internal document automation tool for law firm case management",
+    lifespan=lifespan,
 )
 
 app.include_router(cases.router)
 app.include_router(documents.router)
+app.include_router(admin.router)
 
 STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
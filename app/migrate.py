@@ -0,0 +1,67 @@
+"""Explicit schema step: ``python -m app.migrate``.
+
+Creates missing tables and adds columns introduced since a database was
+created (``create_all`` never alters existing tables). Use with
+``CREATE_SCHEMA_ON_STARTUP=false`` so API and worker processes skip this on boot.
+"""
+
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+from app.database import init_db
+
+logger = logging.getLogger(__name__)
+
+
+def add_missing_columns(conn: Connection) -> list[str]:
+    """ALTER existing tables to add model columns and indexes they lack.
+
+    Returns the ``table.column`` names that were added.
+    """
+    from app.database import Base
+
+    inspector = inspect(conn)
+    added = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+            ddl += column.type.compile(dialect=conn.dialect)
+            default = _literal_default(column)
+            if default is not None:
+                ddl += f" DEFAULT {default}"
+            conn.execute(text(ddl))
+            added.append(f"{table.name}.{column.name}")
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    return added
+
+
+def _literal_default(column) -> str | None:
+    """SQL literal for a column's scalar Python default, so existing rows get it."""
+    if column.default is None or not column.default.is_scalar:
+        return None
+    value = column.default.arg
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return None
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    init_db()
+    logger.info("Database schema is up to date")
+
+
+if __name__ == "__main__":
+    main()
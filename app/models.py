@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, Enum, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -14,6 +14,14 @@ def _utcnow() -> datetime:
 class DocumentStatus(str, enum.Enum):
     pending = "pending"
     processing = "processing"
+    classified = "classified"  # category from the first pages; text still incomplete
+    completed = "completed"
+    failed = "failed"
+
+
+class JobStatus(str, enum.Enum):
+    pending = "pending"
+    running = "running"
     completed = "completed"
     failed = "failed"
 
@@ -27,11 +35,14 @@ class Case(Base):
     created_at = Column(DateTime, default=_utcnow)
     updated_at = Column(DateTime, default=_utcnow, onupdate=_utcnow)
 
+    # Rows are removed by ON DELETE CASCADE in the database, not loaded by the ORM
     documents = relationship(
         "Document", back_populates="case", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     drafts = relationship(
         "Draft", back_populates="case", cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -39,10 +50,14 @@ class Document(Base):
     __tablename__ = "documents"
 
     id = Column(Integer, primary_key=True, index=True)
-    case_id = Column(Integer, ForeignKey("cases.id"), nullable=False)
+    case_id = Column(
+        Integer, ForeignKey("cases.id", ondelete="CASCADE"), nullable=False, index=True,
+    )
     original_filename = Column(String(500), nullable=False)
     stored_path = Column(String(1000), nullable=False)
     file_type = Column(String(20), nullable=False)
+    content_hash = Column(String(64), default="", index=True)
+    content_crc32 = Column(BigInteger, nullable=True)  # ZIP export CRC; unsigned 32-bit
     category = Column(String(100), default="")
     raw_text = Column(Text, default="")
     page_count = Column(Integer, default=0)
@@ -58,10 +73,27 @@ class Draft(Base):
     __tablename__ = "drafts"
 
     id = Column(Integer, primary_key=True, index=True)
-    case_id = Column(Integer, ForeignKey("cases.id"), nullable=False)
+    case_id = Column(
+        Integer, ForeignKey("cases.id", ondelete="CASCADE"), nullable=False, index=True,
+    )
     draft_type = Column(String(50), nullable=False)
     title = Column(String(500), nullable=False)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=_utcnow)
 
     case = relationship("Case", back_populates="drafts")
+
+
+class ReclassifyJob(Base):
+    __tablename__ = "reclassify_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    case_ids = Column(Text, default="")  # comma-separated; empty → all cases
+    status = Column(Enum(JobStatus), default=JobStatus.pending)
+    last_document_id = Column(Integer, default=0)  # resume checkpoint
+    total = Column(Integer, default=0)
+    processed = Column(Integer, default=0)
+    changed = Column(Integer, default=0)
+    error_message = Column(Text, default="")
+    created_at = Column(DateTime, default=_utcnow)
+    updated_at = Column(DateTime, default=_utcnow, onupdate=_utcnow)
@@ -0,0 +1,58 @@
+"""Re-classification CLI: ``python -m app.reclassify``.
+
+Re-runs classification over stored text without re-OCR, e.g. after changing
+``DOCUMENT_CATEGORIES`` or ``LLM_MODEL``:
+
+    python -m app.reclassify                 # every case
+    python -m app.reclassify --case 3 --case 7
+    python -m app.reclassify --resume 12     # continue an interrupted job
+"""
+
+import argparse
+import logging
+
+from app.database import SessionLocal, init_db
+from app.models import ReclassifyJob
+from app.services.reclassifier import create_job, run_job
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-classify stored documents")
+    parser.add_argument("--case", type=int, action="append", default=[], dest="case_ids")
+    parser.add_argument("--resume", type=int, metavar="JOB_ID")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+    )
+    init_db()
+
+    if args.resume:
+        job_id = args.resume
+    else:
+        db = SessionLocal()
+        try:
+            job_id = create_job(db, args.case_ids).id
+        except ValueError as exc:
+            parser.error(str(exc))
+        finally:
+            db.close()
+
+    run_job(job_id)
+
+    db = SessionLocal()
+    try:
+        job = db.query(ReclassifyJob).filter(ReclassifyJob.id == job_id).first()
+        logger.info(
+            "Job %d %s: %d/%d processed, %d changed",
+            job.id, job.status.value, job.processed, job.total, job.changed,
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Admin endpoints: bulk re-classification jobs."""
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_db
+from app.models import JobStatus, ReclassifyJob
+from app.schemas import ReclassifyJobResponse, ReclassifyRequest
+from app.services.reclassifier import create_job, job_case_ids, resumable_filter, run_job
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.post("/reclassify", response_model=ReclassifyJobResponse, status_code=202)
+def start_reclassify(
+    payload: ReclassifyRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    try:
+        job = create_job(db, payload.case_ids)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    # In "worker" mode the job stays pending until app.worker claims it
+    if settings.process_mode == "inline":
+        background_tasks.add_task(run_job, job.id)
+    return _serialize(job)
+
+
+@router.get("/reclassify", response_model=list[ReclassifyJobResponse])
+def list_reclassify_jobs(db: Session = Depends(get_db)):
+    jobs = db.query(ReclassifyJob).order_by(ReclassifyJob.created_at.desc()).all()
+    return [_serialize(j) for j in jobs]
+
+
+@router.get("/reclassify/{job_id}", response_model=ReclassifyJobResponse)
+def get_reclassify_job(job_id: int, db: Session = Depends(get_db)):
+    job = db.query(ReclassifyJob).filter(ReclassifyJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _serialize(job)
+
+
+@router.post("/reclassify/{job_id}/resume", response_model=ReclassifyJobResponse, status_code=202)
+def resume_reclassify_job(
+    job_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    job = db.query(ReclassifyJob).filter(ReclassifyJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    # Failed jobs, and running jobs whose worker died (no checkpoint for a while)
+    resumable = (
+        db.query(ReclassifyJob.id)
+        .filter(ReclassifyJob.id == job_id, resumable_filter())
+        .first()
+    )
+    if job.status != JobStatus.failed and (job.status != JobStatus.running or not resumable):
+        raise HTTPException(status_code=409, detail=f"Job is {job.status.value}")
+
+    job.status = JobStatus.pending
+    db.commit()
+    if settings.process_mode == "inline":
+        background_tasks.add_task(run_job, job.id)
+    return _serialize(job)
+
+
+def _serialize(job: ReclassifyJob) -> dict:
+    """Expand stored case ids before serialization."""
+    return {
+        "id": job.id,
+        "case_ids": job_case_ids(job),
+        "status": job.status.value,
+        "total": job.total,
+        "processed": job.processed,
+        "changed": job.changed,
+        "last_document_id": job.last_document_id,
+        "error_message": job.error_message,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
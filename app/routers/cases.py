@@ -1,12 +1,18 @@
-"""Case management endpoints: create, list, get, delete."""
+"""Case management endpoints: create, list, get, delete, export."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
+import re
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import delete, func
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import Case, Document
+from app.models import Case, Document, Draft
 from app.schemas import CaseCreate, CaseResponse
+from app.services.cleanup import remove_case_files
+from app.services.exporter import build_case_export
+from app.services.organizer import case_folder_name
 
 router = APIRouter(prefix="/cases", tags=["cases"])
 
@@ -35,12 +41,98 @@ def get_case(case_id: int, db: Session = Depends(get_db)):
 
 
 @router.delete("/{case_id}", status_code=204)
-def delete_case(case_id: int, db: Session = Depends(get_db)):
+def delete_case(
+    case_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    case_name = db.query(Case.name).filter(Case.id == case_id).scalar()
+    if case_name is None:
+        raise HTTPException(status_code=404, detail="Case not found")
+
+    # Only the columns needed to find files on disk — never raw_text
+    files = (
+        db.query(Document.stored_path, Document.content_hash, Document.file_type)
+        .filter(Document.case_id == case_id)
+        .all()
+    )
+
+    # Child deletes are explicit so databases created before ON DELETE CASCADE
+    # was declared behave the same; on newer ones the cascade covers them.
+    db.execute(delete(Document).where(Document.case_id == case_id))
+    db.execute(delete(Draft).where(Draft.case_id == case_id))
+    db.execute(delete(Case).where(Case.id == case_id))
+    db.commit()
+
+    background_tasks.add_task(remove_case_files, case_name, [tuple(f) for f in files])
+
+
+@router.get("/{case_id}/export")
+def export_case(case_id: int, request: Request, db: Session = Depends(get_db)):
+    """Stream a ZIP of the case's files, extracted text, drafts, and a manifest.
+
+    Supports single ``Range`` requests (with ``If-Range``) so large downloads
+    can resume.
+    """
     case = db.query(Case).filter(Case.id == case_id).first()
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
-    db.delete(case)
-    db.commit()
+
+    archive = build_case_export(db, case)
+    etag = archive.etag()
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Content-Disposition": f'attachment; filename="{case_folder_name(case.name)}.zip"',
+    }
+
+    byte_range = _parse_range(request.headers.get("range"), archive.size)
+    if_range = request.headers.get("if-range")
+    if byte_range is not None and if_range and if_range != etag:
+        byte_range = None  # archive changed since the partial download began
+
+    if byte_range is None:
+        headers["Content-Length"] = str(archive.size)
+        return StreamingResponse(
+            archive.iter_range(), media_type="application/zip", headers=headers,
+        )
+
+    start, stop = byte_range
+    if start >= stop:
+        return Response(
+            status_code=416, headers={"Content-Range": f"bytes */{archive.size}"},
+        )
+    headers["Content-Length"] = str(stop - start)
+    headers["Content-Range"] = f"bytes {start}-{stop - 1}/{archive.size}"
+    return StreamingResponse(
+        archive.iter_range(start, stop),
+        status_code=206,
+        media_type="application/zip",
+        headers=headers,
+    )
+
+
+def _parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single-range ``bytes=`` header into ``[start, stop)``.
+
+    Returns None to serve the whole archive (no header, an invalid range such
+    as ``bytes=500-400``, or a form we don't support such as multiple ranges),
+    as RFC 9110 requires. An empty range means unsatisfiable.
+    """
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header or "")
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        return max(size - int(last), 0), size
+    start = int(first)
+    if last != "" and int(last) < start:
+        return None
+    if start >= size:
+        return 0, 0
+    stop = size if last == "" else min(int(last) + 1, size)
+    return start, stop
 
 
 def _enrich(case: Case, db: Session) -> dict:
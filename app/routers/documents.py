@@ -1,7 +1,9 @@
 """Document upload, processing, and draft-generation endpoints."""
 
+import hashlib
 import logging
 import uuid
+import zlib
 from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile
@@ -11,10 +13,8 @@ from app.config import settings
 from app.database import get_db
 from app.models import Case, Document, DocumentStatus, Draft
 from app.schemas import DocumentDetail, DocumentResponse, DraftRequest, DraftResponse
-from app.services.classifier import classify_document
 from app.services.generator import generate_draft
-from app.services.ocr import extract_text
-from app.services.organizer import organize_document
+from app.services.pipeline import process_document
 
 logger = logging.getLogger(__name__)
 
@@ -63,13 +63,17 @@ def upload_document(
         original_filename=file.filename or "unknown",
         stored_path=str(temp_path),
         file_type=ext,
+        content_hash=hashlib.sha256(content).hexdigest(),
+        content_crc32=zlib.crc32(content),
         status=DocumentStatus.pending,
     )
     db.add(doc)
     db.commit()
     db.refresh(doc)
 
-    background_tasks.add_task(_process_document, doc.id, case.name, temp_path)
+    # In "worker" mode the document stays pending until app.worker claims it
+    if settings.process_mode == "inline":
+        background_tasks.add_task(process_document, doc.id, case.name, temp_path)
     return doc
 
 
@@ -110,9 +114,10 @@ def generate_case_draft(
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
 
+    # Classified documents are usable but only carry their first pages so far
     query = db.query(Document).filter(
         Document.case_id == case_id,
-        Document.status == DocumentStatus.completed,
+        Document.status.in_([DocumentStatus.completed, DocumentStatus.classified]),
     )
     if payload.document_ids:
         query = query.filter(Document.id.in_(payload.document_ids))
@@ -121,7 +126,7 @@ def generate_case_draft(
     if not documents:
         raise HTTPException(
             status_code=400,
-            detail="No completed documents found for this case",
+            detail="No classified or completed documents found for this case",
         )
 
     doc_data = [
@@ -129,6 +134,7 @@ def generate_case_draft(
             "filename": d.original_filename,
             "category": d.category,
             "text": d.raw_text,
+            "partial": d.status == DocumentStatus.classified,
         }
         for d in documents
     ]
@@ -155,48 +161,3 @@ def list_drafts(case_id: int, db: Session = Depends(get_db)):
         .order_by(Draft.created_at.desc())
         .all()
     )
-
-
-# ── Background processing ─────────────────────────
-
-def _process_document(doc_id: int, case_name: str, file_path: Path):
-    """Background pipeline: Extract → Classify → Organize."""
-    from app.database import SessionLocal
-
-    db = SessionLocal()
-    try:
-        doc = db.query(Document).filter(Document.id == doc_id).first()
-        if not doc:
-            return
-
-        doc.status = DocumentStatus.processing
-        db.commit()
-
-        # Step 1 — Extract text
-        raw_text, page_count = extract_text(file_path)
-        doc.raw_text = raw_text
-        doc.page_count = page_count
-
-        # Step 2 — Classify
-        category = classify_document(raw_text)
-        doc.category = category
-
-        # Step 3 — Organize into folder structure
-        new_path = organize_document(
-            file_path, case_name, category, doc.original_filename,
-        )
-        doc.stored_path = str(new_path)
-
-        doc.status = DocumentStatus.completed
-        db.commit()
-        logger.info(
-            "Processed document %d: %s → %s", doc_id, doc.original_filename, category,
-        )
-
-    except Exception as exc:
-        logger.exception("Failed to process document %d", doc_id)
-        doc.status = DocumentStatus.failed
-        doc.error_message = str(exc)
-        db.commit()
-    finally:
-        db.close()
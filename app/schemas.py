@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 # ── Cases ──────────────────────────────────────────
@@ -9,6 +9,14 @@ class CaseCreate(BaseModel):
     name: str
     description: str = ""
 
+    @field_validator("name")
+    @classmethod
+    def name_not_blank(cls, value: str) -> str:
+        value = value.strip()
+        if not value:
+            raise ValueError("Case name must not be blank")
+        return value
+
 
 class CaseResponse(BaseModel):
     id: int
@@ -57,3 +65,22 @@ class DraftResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+# ── Admin ──────────────────────────────────────────
+
+class ReclassifyRequest(BaseModel):
+    case_ids: list[int] = []  # empty → every case
+
+
+class ReclassifyJobResponse(BaseModel):
+    id: int
+    case_ids: list[int]
+    status: str
+    total: int
+    processed: int
+    changed: int
+    last_document_id: int
+    error_message: str = ""
+    created_at: datetime
+    updated_at: datetime
@@ -33,22 +33,30 @@ def classify_document(text: str) -> str:
         return _rule_based_classify(text)
 
     try:
-        result = llm.complete(
-            CLASSIFICATION_PROMPT.format(text=text[:3000]),
-            max_tokens=50,
-        )
-        category = result.strip()
-
-        if category not in settings.document_categories:
-            logger.warning("LLM returned unknown category '%s', falling back to Other", category)
-            return "Other"
-        return category
+        return classify_with_llm(text)
 
     except Exception as exc:
         logger.error("LLM classification failed: %s — falling back to rules", exc)
         return _rule_based_classify(text)
 
 
+def classify_with_llm(text: str) -> str:
+    """Classify with the LLM only. Errors propagate instead of falling back to rules."""
+    if not text.strip():
+        return "Other"
+
+    result = llm.complete(
+        CLASSIFICATION_PROMPT.format(text=text[:3000]),
+        max_tokens=50,
+    )
+    category = result.strip()
+
+    if category not in settings.document_categories:
+        logger.warning("LLM returned unknown category '%s', falling back to Other", category)
+        return "Other"
+    return category
+
+
 def _rule_based_classify(text: str) -> str:
     """Keyword-based fallback when no API key is configured or the API fails."""
     text_lower = text.lower()
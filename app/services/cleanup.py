@@ -0,0 +1,141 @@
+"""Storage cleanup: remove files for deleted cases and sweep orphans.
+
+Deleting a case only runs SQL; its files are removed afterwards by
+``remove_case_files`` in the background. ``sweep_orphans`` finds anything
+else on disk that no database row points at — stale uploads, unreferenced
+blobs, leftover links, and folders of cases that no longer exist.
+"""
+
+import logging
+import shutil
+import time
+from pathlib import Path
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Case, Document
+from app.services.organizer import BLOB_DIR_NAME, blob_path, case_folder_name
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_DIR_NAME = "_uploads"
+RESERVED_DIRS = {UPLOAD_DIR_NAME, BLOB_DIR_NAME}
+
+
+def remove_case_files(case_name: str, files: list[tuple[str, str, str]]):
+    """Delete a removed case's folder, pending uploads, and now-unreferenced blobs.
+
+    ``files`` holds ``(stored_path, content_hash, file_type)`` captured before
+    the case rows were deleted.
+    """
+    folder = case_folder_name(case_name)
+    paths = [p for p, _, _ in files]
+    hashes = {h for _, h, _ in files if h}
+
+    db = SessionLocal()
+    try:
+        # Another case whose name sanitizes to the same folder shares the tree
+        folder_shared = any(case_folder_name(n) == folder for (n,) in db.query(Case.name))
+        paths_in_use = {
+            p for (p,) in db.query(Document.stored_path).filter(Document.stored_path.in_(paths))
+        }
+        hashes_in_use = {
+            h for (h,) in
+            db.query(Document.content_hash).filter(Document.content_hash.in_(hashes)).distinct()
+        }
+    finally:
+        db.close()
+
+    case_dir = settings.storage_dir / folder
+    if not folder_shared and _is_case_dir(case_dir):
+        shutil.rmtree(case_dir, ignore_errors=True)
+
+    for stored_path in paths:
+        # Covers pending uploads, and links when the folder is shared
+        if stored_path not in paths_in_use:
+            Path(stored_path).unlink(missing_ok=True)
+
+    for _, content_hash, file_type in files:
+        if content_hash and content_hash not in hashes_in_use:
+            blob_path(content_hash, file_type).unlink(missing_ok=True)
+
+    logger.info("Removed files for deleted case '%s' (%d documents)", case_name, len(files))
+
+
+def sweep_orphans(grace_seconds: float | None = None, dry_run: bool = False) -> dict[str, int]:
+    """Remove files under ``storage_dir`` that no database row references.
+
+    Files younger than ``grace_seconds`` are left alone so in-flight uploads
+    and organize steps are never raced. Returns counts per kind of orphan.
+    """
+    grace = settings.cleanup_grace_seconds if grace_seconds is None else grace_seconds
+    cutoff = time.time() - grace
+    root = settings.storage_dir
+    removed = {"uploads": 0, "blobs": 0, "links": 0, "case_dirs": 0}
+    if not root.exists():
+        return removed
+
+    db = SessionLocal()
+    try:
+        case_dirs = {case_folder_name(name) for (name,) in db.query(Case.name)}
+        referenced_paths = {_path_key(Path(p)) for (p,) in db.query(Document.stored_path)}
+        referenced_hashes = {
+            h for (h,) in db.query(Document.content_hash).filter(Document.content_hash != "")
+        }
+    finally:
+        db.close()
+
+    def remove(path: Path, kind: str):
+        removed[kind] += 1
+        logger.info("%s orphan %s: %s", "Would remove" if dry_run else "Removing", kind, path)
+        if dry_run:
+            return
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+    def is_old(path: Path) -> bool:
+        return path.lstat().st_mtime < cutoff
+
+    # An upload stays referenced until organized — and for good if it failed
+    upload_dir = root / UPLOAD_DIR_NAME
+    if upload_dir.is_dir():
+        for path in upload_dir.iterdir():
+            if _path_key(path) not in referenced_paths and is_old(path):
+                remove(path, "uploads")
+
+    blob_dir = root / BLOB_DIR_NAME
+    if blob_dir.is_dir():
+        for path in blob_dir.glob("*/*"):
+            if path.name.split(".")[0] not in referenced_hashes and is_old(path):
+                remove(path, "blobs")
+
+    # Folders still holding referenced links are kept even without a matching
+    # case name (e.g. category folders a blank-named case put directly in root)
+    referenced_dirs = {
+        str(parent) for p in referenced_paths for parent in Path(p).parents[:2]
+    }
+    for case_dir in root.iterdir():
+        if not case_dir.is_dir() or case_dir.name in RESERVED_DIRS:
+            continue
+        if case_dir.name not in case_dirs and str(case_dir.resolve()) not in referenced_dirs:
+            if is_old(case_dir):
+                remove(case_dir, "case_dirs")
+            continue
+        for path in case_dir.glob("*/*"):
+            if _path_key(path) not in referenced_paths and is_old(path):
+                remove(path, "links")
+
+    return removed
+
+
+def _is_case_dir(path: Path) -> bool:
+    """Whether ``path`` is a case folder directly under ``storage_dir``, safe to rmtree."""
+    root = settings.storage_dir.resolve()
+    return path.name not in RESERVED_DIRS and path.resolve().parent == root
+
+
+def _path_key(path: Path) -> str:
+    # Resolve the directory only: the file itself may be a symlink to a blob
+    return str(path.parent.resolve() / path.name)
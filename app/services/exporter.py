@@ -0,0 +1,319 @@
+"""Case export: stream a ZIP of organized files, extracted text, and drafts.
+
+The archive is generated on the fly with constant memory and no temporary
+file. Entries are STORED (documents are already compressed PDFs/images) with
+ZIP64 records throughout, so every byte offset is known before streaming
+starts. That makes the total ``Content-Length`` exact and lets HTTP range
+requests resume mid-archive by seeking straight into the right entry.
+
+Document CRCs are recorded at upload, so resuming near the end of an archive
+never re-reads earlier files. For documents uploaded before that (no stored
+CRC) it is computed while the data streams past, or with one extra read of
+the entry when a range starts after its data.
+"""
+
+import hashlib
+import io
+import json
+import os
+import struct
+import zlib
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import Case, Document, DocumentStatus, Draft
+from app.services.organizer import CATEGORY_FOLDERS
+
+CHUNK_SIZE = 1024 * 1024
+
+_FLAGS = 0x08 | 0x800  # data descriptor follows data | UTF-8 names
+_VERSION = 45          # ZIP64
+_ZIP64_MARK = 0xFFFFFFFF
+_DATA_DESCRIPTOR_SIZE = 24
+
+
+class ZipEntry(NamedTuple):
+    name: str
+    size: int
+    modified: datetime
+    open: Callable[[], BinaryIO]
+    crc: int | None = None  # known up front: stored at upload, or small in-DB entries
+
+
+class ZipStream:
+    """A byte-addressable, lazily generated ZIP64 archive."""
+
+    def __init__(self, entries: list[ZipEntry]):
+        self.entries = entries
+        self._crcs: dict[int, int] = {
+            i: e.crc for i, e in enumerate(entries) if e.crc is not None
+        }
+
+        # (offset, length, kind, entry index) — kinds: header, data, descriptor, tail
+        self._segments: list[tuple[int, int, str, int]] = []
+        self._offsets: list[int] = []
+        offset = 0
+        for i, entry in enumerate(entries):
+            self._offsets.append(offset)
+            header_len = 30 + len(entry.name.encode()) + 20
+            for kind, length in (
+                ("header", header_len),
+                ("data", entry.size),
+                ("descriptor", _DATA_DESCRIPTOR_SIZE),
+            ):
+                self._segments.append((offset, length, kind, i))
+                offset += length
+
+        self._central_offset = offset
+        self._central_size = sum(46 + len(e.name.encode()) + 28 for e in entries)
+        tail_len = self._central_size + 56 + 20 + 22
+        self._segments.append((offset, tail_len, "tail", -1))
+        self.size = offset + tail_len
+
+    def etag(self) -> str:
+        """Validator for If-Range: changes whenever the archive layout changes."""
+        digest = hashlib.sha256()
+        for entry in self.entries:
+            digest.update(
+                f"{entry.name}\0{entry.size}\0{entry.modified.isoformat()}\0{entry.crc}\n".encode()
+            )
+        return f'"{digest.hexdigest()[:32]}"'
+
+    def iter_range(self, start: int = 0, stop: int | None = None) -> Iterator[bytes]:
+        """Yield the archive bytes in ``[start, stop)``."""
+        stop = self.size if stop is None else stop
+        for seg_offset, length, kind, index in self._segments:
+            seg_end = seg_offset + length
+            if seg_end <= start or seg_offset >= stop or length == 0:
+                continue
+            lo = max(start, seg_offset) - seg_offset
+            hi = min(stop, seg_end) - seg_offset
+            if kind == "data":
+                yield from self._iter_data(index, lo, hi)
+            else:
+                yield self._segment_bytes(kind, index)[lo:hi]
+
+    # ── Segment builders ─────────────────────────────
+
+    def _segment_bytes(self, kind: str, index: int) -> bytes:
+        if kind == "header":
+            return self._local_header(index)
+        if kind == "descriptor":
+            entry = self.entries[index]
+            return struct.pack(
+                "<IIQQ", 0x08074B50, self._crc(index), entry.size, entry.size,
+            )
+        return self._tail()
+
+    def _iter_data(self, index: int, lo: int, hi: int) -> Iterator[bytes]:
+        entry = self.entries[index]
+        track_crc = lo == 0 and hi == entry.size and index not in self._crcs
+        crc = 0
+        with entry.open() as f:
+            f.seek(lo)
+            remaining = hi - lo
+            while remaining > 0:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise OSError(f"{entry.name} shrank while exporting")
+                if track_crc:
+                    crc = zlib.crc32(chunk, crc)
+                remaining -= len(chunk)
+                yield chunk
+        if track_crc:
+            self._crcs[index] = crc
+
+    def _crc(self, index: int) -> int:
+        if index not in self._crcs:
+            crc = 0
+            with self.entries[index].open() as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    crc = zlib.crc32(chunk, crc)
+            self._crcs[index] = crc
+        return self._crcs[index]
+
+    def _local_header(self, index: int) -> bytes:
+        entry = self.entries[index]
+        name = entry.name.encode()
+        dos_time, dos_date = _dos_datetime(entry.modified)
+        return (
+            struct.pack(
+                "<IHHHHHIIIHH",
+                0x04034B50, _VERSION, _FLAGS, 0, dos_time, dos_date,
+                0, _ZIP64_MARK, _ZIP64_MARK, len(name), 20,
+            )
+            + name
+            + struct.pack("<HHQQ", 0x0001, 16, 0, 0)
+        )
+
+    def _tail(self) -> bytes:
+        parts = []
+        for i, entry in enumerate(self.entries):
+            name = entry.name.encode()
+            dos_time, dos_date = _dos_datetime(entry.modified)
+            parts.append(
+                struct.pack(
+                    "<IHHHHHHIIIHHHHHII",
+                    0x02014B50, _VERSION, _VERSION, _FLAGS, 0, dos_time, dos_date,
+                    self._crc(i), _ZIP64_MARK, _ZIP64_MARK, len(name), 28, 0, 0, 0,
+                    0o100644 << 16, _ZIP64_MARK,
+                )
+                + name
+                + struct.pack("<HHQQQ", 0x0001, 24, entry.size, entry.size, self._offsets[i])
+            )
+
+        count = len(self.entries)
+        eocd64_offset = self._central_offset + self._central_size
+        parts.append(struct.pack(
+            "<IQHHIIQQQQ",
+            0x06064B50, 44, _VERSION, _VERSION, 0, 0,
+            count, count, self._central_size, self._central_offset,
+        ))
+        parts.append(struct.pack("<IIQI", 0x07064B50, 0, eocd64_offset, 1))
+        parts.append(struct.pack(
+            "<IHHHHIIH",
+            0x06054B50, 0, 0, 0xFFFF, 0xFFFF, _ZIP64_MARK, _ZIP64_MARK, 0,
+        ))
+        return b"".join(parts)
+
+
+def build_case_export(db: Session, case: Case) -> ZipStream:
+    """Plan a case archive: organized files, extracted text, drafts, and a manifest.
+
+    Only sizes and CRCs are kept in memory; content is loaded per entry while
+    streaming.
+    """
+    entries: list[ZipEntry] = []
+    used_names: set[str] = set()
+    manifest_docs = []
+
+    docs = (
+        db.query(
+            Document.id,
+            Document.original_filename,
+            Document.stored_path,
+            Document.category,
+            Document.status,
+            Document.page_count,
+            Document.content_hash,
+            Document.content_crc32,
+            Document.created_at,
+        )
+        .filter(Document.case_id == case.id)
+        .order_by(Document.id)
+        .all()
+    )
+    for doc in docs:
+        folder = CATEGORY_FOLDERS.get(doc.category, "other")
+        record = {
+            "id": doc.id,
+            "original_filename": doc.original_filename,
+            "category": doc.category,
+            "status": doc.status.value,
+            "page_count": doc.page_count,
+            "sha256": doc.content_hash,
+            "file": None,
+            "text": None,
+        }
+
+        path = Path(doc.stored_path)
+        organized = doc.status in (DocumentStatus.completed, DocumentStatus.classified)
+        if organized and path.is_file():
+            name = _unique(f"documents/{folder}/{path.name}", used_names)
+            stat = path.stat()
+            entries.append(ZipEntry(
+                name, stat.st_size, datetime.fromtimestamp(stat.st_mtime),
+                lambda p=path: open(p, "rb"), doc.content_crc32,
+            ))
+            record["file"] = name
+
+        size, crc = _text_stats(db, Document.raw_text, Document.id, doc.id)
+        if size:
+            stem = path.stem if record["file"] else Path(doc.original_filename).stem
+            name = _unique(f"text/{folder}/{stem}.txt", used_names)
+            entries.append(ZipEntry(
+                name, size, doc.created_at,
+                lambda i=doc.id: _open_text(Document.raw_text, Document.id, i), crc,
+            ))
+            record["text"] = name
+        manifest_docs.append(record)
+
+    manifest_drafts = []
+    drafts = (
+        db.query(Draft.id, Draft.draft_type, Draft.title, Draft.created_at)
+        .filter(Draft.case_id == case.id)
+        .order_by(Draft.id)
+        .all()
+    )
+    for draft in drafts:
+        size, crc = _text_stats(db, Draft.content, Draft.id, draft.id)
+        name = _unique(f"drafts/{draft.id}_{draft.draft_type}.md", used_names)
+        entries.append(ZipEntry(
+            name, size, draft.created_at,
+            lambda i=draft.id: _open_text(Draft.content, Draft.id, i), crc,
+        ))
+        manifest_drafts.append({
+            "id": draft.id,
+            "draft_type": draft.draft_type,
+            "title": draft.title,
+            "created_at": draft.created_at.isoformat(),
+            "file": name,
+        })
+
+    manifest = json.dumps(
+        {
+            "case": {
+                "id": case.id,
+                "name": case.name,
+                "description": case.description,
+                "created_at": case.created_at.isoformat(),
+            },
+            "documents": manifest_docs,
+            "drafts": manifest_drafts,
+        },
+        indent=2,
+        ensure_ascii=False,
+    ).encode()
+    entries.insert(0, ZipEntry(
+        "manifest.json", len(manifest), case.updated_at or case.created_at,
+        lambda: io.BytesIO(manifest), zlib.crc32(manifest),
+    ))
+    return ZipStream(entries)
+
+
+def _text_stats(db: Session, column, id_column, row_id: int) -> tuple[int, int]:
+    """Encoded size and CRC of one text column, without keeping the text around."""
+    text = db.query(column).filter(id_column == row_id).scalar() or ""
+    data = text.encode()
+    return len(data), zlib.crc32(data)
+
+
+def _open_text(column, id_column, row_id: int) -> BinaryIO:
+    db = SessionLocal()
+    try:
+        text = db.query(column).filter(id_column == row_id).scalar() or ""
+    finally:
+        db.close()
+    return io.BytesIO(text.encode())
+
+
+def _unique(name: str, used: set[str]) -> str:
+    base, ext = os.path.splitext(name)
+    candidate, counter = name, 1
+    while candidate in used:
+        candidate = f"{base}_{counter}{ext}"
+        counter += 1
+    used.add(candidate)
+    return candidate
+
+
+def _dos_datetime(value: datetime) -> tuple[int, int]:
+    value = max(value, datetime(1980, 1, 1, tzinfo=value.tzinfo))
+    dos_time = (value.hour << 11) | (value.minute << 5) | (value.second // 2)
+    dos_date = ((value.year - 1980) << 9) | (value.month << 5) | value.day
+    return dos_time, dos_date
@@ -2,6 +2,7 @@
 
 import logging
 
+from app.config import settings
 from app.services import llm
 
 logger = logging.getLogger(__name__)
@@ -45,7 +46,10 @@ def generate_draft(
 
     doc_blocks = []
     for doc in documents:
-        block = f"**{doc['filename']}** ({doc['category']})\n{doc['text'][:2000]}"
+        note = ""
+        if doc.get("partial"):
+            note = " [text incomplete: first pages only, extraction in progress]"
+        block = f"**{doc['filename']}** ({doc['category']}){note}\n{doc['text'][:2000]}"
         doc_blocks.append(block)
 
     documents_text = "\n\n---\n\n".join(doc_blocks)
@@ -57,7 +61,9 @@ def generate_draft(
         return title, _fallback_content(draft_type, documents)
 
     try:
-        content = llm.complete(prompt, max_tokens=4096)
+        content = llm.complete(
+            prompt, max_tokens=4096, timeout=settings.llm_draft_timeout_seconds,
+        )
         return title, content
 
     except Exception as exc:
@@ -74,7 +80,8 @@ def _fallback_content(draft_type: str, documents: list[dict]) -> str:
         "",
     ]
     for doc in documents:
-        lines.append(f"- {doc['filename']} ({doc['category']})")
+        note = " — text still extracting" if doc.get("partial") else ""
+        lines.append(f"- {doc['filename']} ({doc['category']}){note}")
     lines.append("")
     lines.append("*Configure an LLM API key in .env for AI-generated content.*")
     return "\n".join(lines)
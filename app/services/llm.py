@@ -1,6 +1,22 @@
-"""Unified LLM client — supports Gemini, Anthropic, and OpenAI."""
+"""Unified LLM client — supports Gemini, Anthropic, and OpenAI.
+
+Every call goes through a provider-aware rate limiter (request and token
+buckets plus a concurrency cap) whose state lives in a small SQLite file, so
+all API and worker processes on a host share one budget. Throttling and
+server errors are retried with jittered exponential backoff, honouring
+``Retry-After`` when the provider sends it. Each call has a total time budget
+covering queueing, retries and the request itself; once it runs out the
+error propagates so the caller's fallback runs.
+"""
 
 import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
 
 from app.config import settings
 
@@ -8,6 +24,12 @@ logger = logging.getLogger(__name__)
 
 PROVIDERS = ("gemini", "anthropic", "openai")
 
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+# A lease outlives the longest possible request (the client timeout) by this
+# margin; after that the slot is assumed held by a crashed process.
+LEASE_MARGIN_SECONDS = 30.0
+CHARS_PER_TOKEN = 4
+
 
 def is_configured() -> bool:
     """Check if the active LLM provider has a valid API key."""
@@ -19,8 +41,18 @@ def is_configured() -> bool:
     return bool(keys.get(settings.llm_provider))
 
 
-def complete(prompt: str, max_tokens: int = 4096) -> str:
-    """Send a prompt to the configured LLM and return the response text."""
+class LLMTimeoutError(TimeoutError):
+    """The call's total time budget ran out while waiting for capacity."""
+
+
+def complete(prompt: str, max_tokens: int = 4096, timeout: float | None = None) -> str:
+    """Send a prompt to the configured LLM and return the response text.
+
+    Waits for rate-limit capacity and retries throttling/5xx errors before
+    giving up, so callers only see an exception once retries are exhausted or
+    ``timeout`` seconds (default ``settings.llm_total_timeout_seconds``) have
+    passed.
+    """
     provider = settings.llm_provider
 
     dispatch = {
@@ -33,15 +65,276 @@ def complete(prompt: str, max_tokens: int = 4096) -> str:
     if not fn:
         raise ValueError(f"Unknown LLM provider: {provider}. Use one of: {PROVIDERS}")
 
-    return fn(prompt, max_tokens)
+    limiter = get_limiter()
+    cost = len(prompt) // CHARS_PER_TOKEN + max_tokens
+    deadline = time.time() + (settings.llm_total_timeout_seconds if timeout is None else timeout)
+    lease_seconds = settings.llm_request_timeout_seconds + LEASE_MARGIN_SECONDS
+
+    attempt = 0
+    while True:
+        with limiter.acquire(provider, cost, deadline, lease_seconds):
+            request_timeout = min(settings.llm_request_timeout_seconds, deadline - time.time())
+            try:
+                return fn(prompt, max_tokens, max(request_timeout, 1.0))
+            except Exception as exc:
+                if attempt >= settings.llm_max_retries or not _is_retryable(exc):
+                    raise
+                error = exc
+
+        retry_after = _retry_after(error)
+        delay = retry_after if retry_after is not None else _backoff(attempt)
+        if _status_code(error) == 429:
+            limiter.cooldown(provider, delay)
+        if time.time() + delay >= deadline:
+            raise error
+
+        attempt += 1
+        logger.warning(
+            "%s call failed (%s), retry %d/%d in %.1fs",
+            provider, error, attempt, settings.llm_max_retries, delay,
+        )
+        time.sleep(delay)
+
+
+# ── Rate limiting ──────────────────────────────────
+
+class RateLimiter:
+    """Token-bucket + concurrency limiter shared across processes via SQLite.
+
+    ``clock`` and ``sleep`` are injectable so the limiter can be driven
+    deterministically against a fake provider.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int,
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        self.db_path = db_path
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self._clock = clock
+        self._sleep = sleep
+        self._init_db()
+
+    @contextmanager
+    def acquire(
+        self,
+        provider: str,
+        tokens: int,
+        deadline: float | None = None,
+        lease_seconds: float = 300.0,
+    ):
+        """Block until a request slot, ``tokens`` budget and a concurrency slot are free.
+
+        Raises ``LLMTimeoutError`` if that would take past ``deadline``. The
+        slot is held for at most ``lease_seconds``, which must exceed the
+        client timeout of the call made inside the block.
+        """
+        while True:
+            wait = self._try_take(provider, tokens)
+            if wait <= 0:
+                break
+            self._check_deadline(deadline, wait)
+            self._sleep(wait)
+
+        lease_id = self._acquire_slot(provider, deadline, lease_seconds)
+        try:
+            yield
+        finally:
+            self._release_slot(lease_id)
+
+    def cooldown(self, provider: str, seconds: float):
+        """Pause every process's calls to ``provider`` for ``seconds``."""
+        until = self._clock() + seconds
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO cooldowns (provider, until) VALUES (?, ?) "
+                "ON CONFLICT(provider) DO UPDATE SET until = MAX(until, excluded.until)",
+                (provider, until),
+            )
+
+    def _try_take(self, provider: str, tokens: int) -> float:
+        """Take from both buckets if possible. Returns 0, or seconds to wait."""
+        now = self._clock()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT until FROM cooldowns WHERE provider = ?", (provider,),
+            ).fetchone()
+            if row and row[0] > now:
+                return row[0] - now
+
+            buckets = [
+                (f"{provider}:requests", self.requests_per_minute, 1),
+                (f"{provider}:tokens", self.tokens_per_minute, min(tokens, self.tokens_per_minute)),
+            ]
+            levels = []
+            wait = 0.0
+            for name, per_minute, cost in buckets:
+                level = self._refill(conn, name, per_minute, now)
+                levels.append(level)
+                if level < cost:
+                    wait = max(wait, (cost - level) * 60.0 / per_minute)
+            if wait > 0:
+                return wait
+
+            for (name, _, cost), level in zip(buckets, levels):
+                conn.execute(
+                    "UPDATE buckets SET level = ?, updated = ? WHERE name = ?",
+                    (level - cost, now, name),
+                )
+            return 0.0
+
+    def _refill(self, conn: sqlite3.Connection, name: str, per_minute: int, now: float) -> float:
+        row = conn.execute(
+            "SELECT level, updated FROM buckets WHERE name = ?", (name,),
+        ).fetchone()
+        if row is None:
+            conn.execute(
+                "INSERT INTO buckets (name, level, updated) VALUES (?, ?, ?)",
+                (name, float(per_minute), now),
+            )
+            return float(per_minute)
+        level, updated = row
+        return min(float(per_minute), level + (now - updated) * per_minute / 60.0)
+
+    def _check_deadline(self, deadline: float | None, wait: float):
+        if deadline is not None and self._clock() + wait > deadline:
+            raise LLMTimeoutError(f"LLM capacity not available within budget (wait {wait:.1f}s)")
+
+    def _acquire_slot(self, provider: str, deadline: float | None, lease_seconds: float) -> str:
+        lease_id = uuid.uuid4().hex
+        while True:
+            now = self._clock()
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM leases WHERE expires < ?", (now,))
+                (active,) = conn.execute(
+                    "SELECT COUNT(*) FROM leases WHERE provider = ?", (provider,),
+                ).fetchone()
+                if active < self.max_concurrency:
+                    conn.execute(
+                        "INSERT INTO leases (id, provider, expires) VALUES (?, ?, ?)",
+                        (lease_id, provider, now + lease_seconds),
+                    )
+                    return lease_id
+            wait = 0.05 + random.random() * 0.1
+            self._check_deadline(deadline, wait)
+            self._sleep(wait)
+
+    def _release_slot(self, lease_id: str):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM leases WHERE id = ?", (lease_id,))
+
+    @contextmanager
+    def _transaction(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS buckets (
+                    name TEXT PRIMARY KEY, level REAL NOT NULL, updated REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS leases (
+                    id TEXT PRIMARY KEY, provider TEXT NOT NULL, expires REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS cooldowns (
+                    provider TEXT PRIMARY KEY, until REAL NOT NULL
+                );
+                """
+            )
+        finally:
+            conn.close()
+
+
+_limiter: RateLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    """Return the process-wide limiter, creating it on first use."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(
+                settings.llm_limiter_db,
+                settings.llm_requests_per_minute,
+                settings.llm_tokens_per_minute,
+                settings.llm_max_concurrency,
+            )
+        return _limiter
+
+
+def _status_code(exc: Exception) -> int | None:
+    # anthropic/openai expose .status_code; google-genai exposes .code
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if _status_code(exc) in RETRYABLE_STATUS:
+        return True
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    # SDK transport errors: APIConnectionError, APITimeoutError, …
+    name = type(exc).__name__
+    return name.endswith(("ConnectionError", "TimeoutError"))
+
+
+def _retry_after(exc: Exception) -> float | None:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    try:
+        return min(float(value), settings.llm_backoff_max_seconds) if value else None
+    except ValueError:
+        return None  # HTTP-date form is rare for these APIs
+
+
+def _backoff(attempt: int) -> float:
+    """Full-jitter exponential backoff."""
+    ceiling = min(
+        settings.llm_backoff_max_seconds,
+        settings.llm_backoff_base_seconds * 2 ** attempt,
+    )
+    return random.uniform(0, ceiling)
 
 
 # ── Provider implementations ───────────────────────
+# SDK-level retries are disabled so the limiter above owns retry policy, and
+# every request carries a client timeout that bounds its concurrency lease.
 
-def _gemini_complete(prompt: str, max_tokens: int) -> str:
+def _gemini_complete(prompt: str, max_tokens: int, timeout: float) -> str:
     from google import genai
 
-    client = genai.Client(api_key=settings.google_api_key)
+    http_options = {"timeout": int(timeout * 1000)}  # milliseconds
+    if settings.llm_base_url:
+        http_options["base_url"] = settings.llm_base_url
+    client = genai.Client(api_key=settings.google_api_key, http_options=http_options)
     response = client.models.generate_content(
         model=settings.llm_model,
         contents=prompt,
@@ -50,10 +343,15 @@ def _gemini_complete(prompt: str, max_tokens: int) -> str:
     return response.text
 
 
-def _anthropic_complete(prompt: str, max_tokens: int) -> str:
+def _anthropic_complete(prompt: str, max_tokens: int, timeout: float) -> str:
     import anthropic
 
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    client = anthropic.Anthropic(
+        api_key=settings.anthropic_api_key,
+        base_url=settings.llm_base_url or None,
+        max_retries=0,
+        timeout=timeout,
+    )
     message = client.messages.create(
         model=settings.llm_model,
         max_tokens=max_tokens,
@@ -62,10 +360,15 @@ def _anthropic_complete(prompt: str, max_tokens: int) -> str:
     return message.content[0].text
 
 
-def _openai_complete(prompt: str, max_tokens: int) -> str:
+def _openai_complete(prompt: str, max_tokens: int, timeout: float) -> str:
     from openai import OpenAI
 
-    client = OpenAI(api_key=settings.openai_api_key)
+    client = OpenAI(
+        api_key=settings.openai_api_key,
+        base_url=settings.llm_base_url or None,
+        max_retries=0,
+        timeout=timeout,
+    )
     response = client.chat.completions.create(
         model=settings.llm_model,
         max_tokens=max_tokens,
@@ -1,12 +1,18 @@
 """Text extraction: native PDF parsing with OCR fallback for scanned documents."""
 
 import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import NamedTuple
 
-import pdfplumber
-import pytesseract
-from pdf2image import convert_from_path
-from PIL import Image
+from app.config import settings
+
+# pdfplumber, pypdfium2, pytesseract, pdf2image and PIL are imported inside the functions
+# that use them so that importing this module (and the API) stays cheap.
 
 logger = logging.getLogger(__name__)
 
@@ -14,50 +20,209 @@ IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".tiff", ".tif"}
 MIN_TEXT_DENSITY = 50  # chars per page to consider "has text"
 
 
-def extract_text(file_path: Path) -> tuple[str, int]:
-    """Extract text from a document. Returns (text, page_count)."""
+def extract_text(file_path: Path, engine: str | None = None) -> tuple[str, int]:
+    """Extract text from a document. Returns (text, page_count).
+
+    ``engine`` overrides ``settings.pdf_text_engine`` for this file.
+    """
+    pages_text, page_count, _ = extract_page_range(file_path, engine=engine)
+    return "\n\n".join(pages_text), page_count
+
+
+def extract_page_range(
+    file_path: Path,
+    start: int = 0,
+    stop: int | None = None,
+    engine: str | None = None,
+    ocr: bool | None = None,
+) -> tuple[list[str], int, bool]:
+    """Extract text for pages ``[start, stop)``. Returns (pages, page_count, used_ocr).
+
+    ``ocr=None`` decides from the native text density of the range; ``True`` or
+    ``False`` forces OCR on or off.
+    """
     ext = file_path.suffix.lower()
 
     if ext in IMAGE_EXTENSIONS:
-        return _ocr_image(file_path), 1
+        return ([_ocr_image(file_path)] if start == 0 else []), 1, True
 
     if ext == ".pdf":
-        return _extract_pdf(file_path)
+        return _extract_pdf(file_path, engine or settings.pdf_text_engine, start, stop, ocr)
 
     raise ValueError(f"Unsupported file type: {ext}")
 
 
-def _extract_pdf(file_path: Path) -> tuple[str, int]:
-    """Extract text from PDF, falling back to OCR for scanned pages."""
-    pages_text: list[str] = []
+# ── Native PDF text engines ────────────────────────
+# Each engine is a pair of module-level functions (picklable, so page ranges
+# can be farmed out to worker processes).
+
+class PdfEngine(NamedTuple):
+    page_count: Callable[[Path], int]
+    extract_pages: Callable[[Path, int, int], list[str]]
+
+
+def _pdfplumber_page_count(file_path: Path) -> int:
+    import pdfplumber
 
     with pdfplumber.open(file_path) as pdf:
-        page_count = len(pdf.pages)
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            pages_text.append(text)
+        return len(pdf.pages)
+
 
-    combined = "\n\n".join(pages_text)
-    avg_chars = len(combined) / max(page_count, 1)
+def _pdfplumber_pages(file_path: Path, start: int, stop: int) -> list[str]:
+    """Layout-aware extraction: slower, best reading order on complex layouts."""
+    import pdfplumber
 
+    with pdfplumber.open(file_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[start:stop]]
+
+
+def _pdfium_page_count(file_path: Path) -> int:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _pdfium_pages(file_path: Path, start: int, stop: int) -> list[str]:
+    """PDFium text layer: no layout analysis, much faster on long native PDFs."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        pages_text = []
+        for index in range(start, min(stop, len(pdf))):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            pages_text.append(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+        return pages_text
+    finally:
+        pdf.close()
+
+
+PDF_ENGINES: dict[str, PdfEngine] = {
+    "pdfplumber": PdfEngine(_pdfplumber_page_count, _pdfplumber_pages),
+    "pdfium": PdfEngine(_pdfium_page_count, _pdfium_pages),
+}
+
+
+def extract_pdf_pages(
+    file_path: Path,
+    engine: str,
+    start: int = 0,
+    stop: int | None = None,
+) -> tuple[list[str], int]:
+    """Extract native text for pages ``[start, stop)``. Returns (pages, page_count).
+
+    Long ranges are split into chunks and extracted in parallel processes
+    when ``settings.pdf_extract_workers`` > 1.
+    """
+    impl = _pdf_engine(engine)
+    page_count = impl.page_count(file_path)
+    stop = page_count if stop is None else min(stop, page_count)
+
+    workers = settings.pdf_extract_workers
+    if workers <= 1 or stop - start < settings.pdf_parallel_min_pages:
+        return impl.extract_pages(file_path, start, stop), page_count
+
+    chunk = -(-(stop - start) // workers)
+    bounds = [(lo, min(lo + chunk, stop)) for lo in range(start, stop, chunk)]
+    pool = _extract_pool(workers)
+    try:
+        futures = [pool.submit(impl.extract_pages, file_path, lo, hi) for lo, hi in bounds]
+        pages_text = [text for future in futures for text in future.result()]
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
+    return pages_text, page_count
+
+
+# A child that crashes (e.g. OOM on a huge page) breaks the whole pool, so a
+# broken pool is dropped and the next PDF starts a fresh one.
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _extract_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process-wide extraction pool, creating it on first use.
+
+    Children are started with forkserver/spawn rather than fork: forking a
+    process that holds DB connections, SDK clients and threads is unsafe, and
+    reusing one pool avoids paying interpreter start-up for every PDF.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(method),
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _pdf_engine(engine: str) -> PdfEngine:
+    impl = PDF_ENGINES.get(engine)
+    if not impl:
+        raise ValueError(f"Unknown PDF engine: {engine}. Use one of: {list(PDF_ENGINES)}")
+    return impl
+
+
+def _extract_pdf(
+    file_path: Path,
+    engine: str,
+    start: int,
+    stop: int | None,
+    ocr: bool | None,
+) -> tuple[list[str], int, bool]:
+    """Extract text from PDF pages, falling back to OCR for scanned pages."""
+    if ocr:
+        page_count = _pdf_engine(engine).page_count(file_path)
+        stop = page_count if stop is None else min(stop, page_count)
+        return _ocr_pdf(file_path, start, stop), page_count, True
+
+    pages_text, page_count = extract_pdf_pages(file_path, engine, start, stop)
+    if ocr is False or not pages_text:
+        return pages_text, page_count, False
+
+    avg_chars = sum(len(text) for text in pages_text) / len(pages_text)
     if avg_chars < MIN_TEXT_DENSITY:
         logger.info(
             "Low text density (%.0f chars/page), running OCR on %s",
             avg_chars, file_path.name,
         )
-        return _ocr_pdf(file_path), page_count
+        return _ocr_pdf(file_path, start, start + len(pages_text)), page_count, True
+
+    return pages_text, page_count, False
 
-    return combined, page_count
 
+def _ocr_pdf(file_path: Path, start: int, stop: int) -> list[str]:
+    """OCR pages ``[start, stop)`` of a scanned PDF by converting them to images first."""
+    import pytesseract
+    from pdf2image import convert_from_path
 
-def _ocr_pdf(file_path: Path) -> str:
-    """OCR a scanned PDF by converting pages to images first."""
-    images = convert_from_path(file_path, dpi=300)
-    pages_text = [pytesseract.image_to_string(img) for img in images]
-    return "\n\n".join(pages_text)
+    if stop <= start:
+        return []
+    images = convert_from_path(file_path, dpi=300, first_page=start + 1, last_page=stop)
+    return [pytesseract.image_to_string(img) for img in images]
 
 
 def _ocr_image(file_path: Path) -> str:
     """OCR a single image file."""
+    import pytesseract
+    from PIL import Image
+
     image = Image.open(file_path)
     return pytesseract.image_to_string(image)
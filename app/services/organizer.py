@@ -1,6 +1,15 @@
-"""File organization: move processed documents into a structured folder tree."""
+"""File organization: content-addressed blob store with linked case/category views.
 
+Each uploaded file is stored exactly once under ``storage/_blobs/<aa>/<sha256><ext>``.
+The human-readable ``storage/<case>/<category>/`` tree is made of hardlinks (or
+symlinks) pointing at those blobs, so re-categorizing a document only touches
+directory entries — never file bytes. Every document gets its own link, even
+when several documents share a blob.
+"""
+
+import hashlib
 import logging
+import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
@@ -21,33 +30,157 @@ CATEGORY_FOLDERS: dict[str, str] = {
     "Other":                 "other",
 }
 
+BLOB_DIR_NAME = "_blobs"
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 def organize_document(
     source_path: Path,
     case_name: str,
     category: str,
     original_filename: str,
+    content_hash: str = "",
 ) -> Path:
-    """Move a document into the organized case folder. Returns the new path."""
-    folder_name = CATEGORY_FOLDERS.get(category, "other")
-    safe_case = _sanitize(case_name)
+    """Store a document as a blob and link it into the case folder. Returns the link path."""
+    blob = store_blob(source_path, content_hash)
+    target_path = link_document(blob, case_name, category, original_filename)
+    logger.info("Organized: %s → %s", original_filename, target_path)
+    return target_path
+
+
+def store_blob(source_path: Path, content_hash: str = "") -> Path:
+    """Move a file into the blob store under its content hash. Returns the blob path.
+
+    If an identical blob already exists the source is simply discarded.
+    """
+    digest = content_hash or hash_file(source_path)
+    blob = blob_path(digest, source_path.suffix)
+    if blob.exists():
+        source_path.unlink(missing_ok=True)
+        return blob
+
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # _uploads lives under storage_dir, so this is normally a rename
+        os.replace(source_path, blob)
+    except OSError:
+        shutil.move(str(source_path), str(blob))
+    return blob
+
 
-    target_dir = settings.storage_dir / safe_case / folder_name
+def link_document(
+    blob: Path,
+    case_name: str,
+    category: str,
+    original_filename: str,
+) -> Path:
+    """Create a view link for a blob in the case/category tree. Returns the link path."""
+    target_dir = _category_dir(case_name, category)
     target_dir.mkdir(parents=True, exist_ok=True)
 
     date_prefix = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     stem = _sanitize(Path(original_filename).stem)
     ext = Path(original_filename).suffix.lower()
-    target_path = target_dir / f"{date_prefix}_{stem}{ext}"
+    return _link_unique(blob, target_dir, f"{date_prefix}_{stem}", ext)
+
+
+def relink_document(
+    stored_path: Path,
+    content_hash: str,
+    case_name: str,
+    category: str,
+) -> tuple[Path, str]:
+    """Move a document's view link to a new case/category folder without copying data.
+
+    The existing file name is kept (with a counter on collisions). Documents
+    organized before the blob store existed are added to it first; their file
+    stays in place until the new link exists, so a failure leaves the document
+    as it was. Returns ``(new link path, content hash)``.
+    """
+    target_dir = _category_dir(case_name, category)
+    if stored_path.parent == target_dir and stored_path.exists():
+        return stored_path, content_hash
+
+    if not content_hash:
+        content_hash = hash_file(stored_path)
+        _copy_into_store(stored_path, blob_path(content_hash, stored_path.suffix))
 
+    blob = blob_path(content_hash, stored_path.suffix)
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    new_path = _link_unique(blob, target_dir, stored_path.stem, stored_path.suffix)
+    stored_path.unlink(missing_ok=True)
+    return new_path, content_hash
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blob_path(content_hash: str, ext: str) -> Path:
+    """Location of a blob in the content-addressed store."""
+    return (
+        settings.storage_dir / BLOB_DIR_NAME / content_hash[:2]
+        / f"{content_hash}{ext.lower()}"
+    )
+
+
+def case_folder_name(case_name: str) -> str:
+    """Directory name used for a case under ``storage_dir``. Never empty."""
+    return _sanitize(case_name) or "unnamed_case"
+
+
+def _category_dir(case_name: str, category: str) -> Path:
+    folder_name = CATEGORY_FOLDERS.get(category, "other")
+    return settings.storage_dir / case_folder_name(case_name) / folder_name
+
+
+def _link_unique(blob: Path, target_dir: Path, stem: str, ext: str) -> Path:
+    """Link ``blob`` into ``target_dir``, appending a counter on name collisions.
+
+    Collisions are detected by the link call itself rather than a separate
+    ``exists()`` probe. A new link is always created, so no two documents
+    share a path even when their bytes are identical.
+    """
+    target_path = target_dir / f"{stem}{ext}"
     counter = 1
-    while target_path.exists():
-        target_path = target_dir / f"{date_prefix}_{stem}_{counter}{ext}"
-        counter += 1
+    while True:
+        try:
+            _make_link(blob, target_path)
+            return target_path
+        except FileExistsError:
+            target_path = target_dir / f"{stem}_{counter}{ext}"
+            counter += 1
 
-    shutil.move(str(source_path), str(target_path))
-    logger.info("Organized: %s → %s", original_filename, target_path)
-    return target_path
+
+def _copy_into_store(source_path: Path, blob: Path) -> None:
+    """Add ``source_path`` to the blob store without removing it."""
+    if blob.exists():
+        return
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source_path, blob)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copy2(source_path, blob)
+
+
+def _make_link(blob: Path, target_path: Path) -> None:
+    if settings.organizer_link_mode == "hardlink":
+        try:
+            os.link(blob, target_path)
+            return
+        except FileExistsError:
+            raise
+        except OSError:
+            logger.warning("Hardlink failed for %s, falling back to symlink", target_path)
+    os.symlink(os.path.relpath(blob, target_path.parent), target_path)
 
 
 def _sanitize(name: str) -> str:
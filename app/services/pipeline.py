@@ -0,0 +1,162 @@
+"""Document processing pipeline: Extract → Classify → Organize.
+
+Shared by the API process (via ``BackgroundTasks``) and the standalone
+extraction worker (``python -m app.worker``).
+
+Classification only needs the start of a document, so the pipeline extracts
+the first ``classify_preview_pages`` pages, classifies and organizes the file,
+and publishes that as ``classified`` before extracting the remaining pages.
+If that last step fails the document stays ``classified`` with an
+``error_message``; if its process dies, the worker finishes it later. While
+the remaining pages extract, a heartbeat keeps the document from looking
+abandoned.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Document, DocumentStatus
+from app.services.classifier import classify_document
+from app.services.ocr import extract_page_range
+from app.services.organizer import organize_document
+
+logger = logging.getLogger(__name__)
+
+
+def process_document(doc_id: int, case_name: str, file_path: Path):
+    """Run the full pipeline for one uploaded document."""
+    db = SessionLocal()
+    # Once classified, the document stays usable even if later steps fail
+    failed_status = DocumentStatus.failed
+    try:
+        doc = db.query(Document).filter(Document.id == doc_id).first()
+        if not doc:
+            return
+
+        doc.status = DocumentStatus.processing
+        db.commit()
+
+        # Step 1 — Extract the first pages
+        preview = settings.classify_preview_pages
+        pages_text, page_count, _ = extract_page_range(file_path, 0, preview)
+        doc.raw_text = "\n\n".join(pages_text)
+        doc.page_count = page_count
+
+        # Step 2 — Classify
+        category = classify_document(doc.raw_text)
+        doc.category = category
+
+        # Step 3 — Organize into folder structure
+        new_path = organize_document(
+            file_path, case_name, category, doc.original_filename, doc.content_hash,
+        )
+        doc.stored_path = str(new_path)
+
+        complete = page_count <= preview
+        doc.status = DocumentStatus.completed if complete else DocumentStatus.classified
+        db.commit()
+        failed_status = DocumentStatus.classified
+        logger.info(
+            "Classified document %d: %s → %s", doc_id, doc.original_filename, category,
+        )
+        if complete:
+            return
+
+        # Step 4 — Extract the remaining pages. OCR is decided from their own
+        # density: a typed cover is often followed by scanned exhibits.
+        with _heartbeat(doc_id):
+            rest, _, _ = extract_page_range(new_path, preview, None)
+        doc.raw_text = "\n\n".join(pages_text + rest)
+        doc.status = DocumentStatus.completed
+        db.commit()
+        logger.info("Extracted document %d: %d pages", doc_id, page_count)
+
+    except Exception as exc:
+        logger.exception("Failed to process document %d", doc_id)
+        _record_failure(db, doc_id, failed_status, exc)
+    finally:
+        db.close()
+
+
+def finish_extraction(doc_id: int):
+    """Complete a document left ``classified`` when its process died during step 4.
+
+    The preview split isn't stored, so the whole file is extracted again.
+    """
+    db = SessionLocal()
+    try:
+        doc = db.query(Document).filter(Document.id == doc_id).first()
+        if not doc or doc.status != DocumentStatus.classified:
+            return
+
+        with _heartbeat(doc_id):
+            pages_text, page_count, _ = extract_page_range(Path(doc.stored_path))
+        doc.raw_text = "\n\n".join(pages_text)
+        doc.page_count = page_count
+        doc.status = DocumentStatus.completed
+        db.commit()
+        logger.info("Extracted document %d: %d pages", doc_id, page_count)
+
+    except Exception as exc:
+        logger.exception("Failed to finish extracting document %d", doc_id)
+        _record_failure(db, doc_id, DocumentStatus.classified, exc)
+    finally:
+        db.close()
+
+
+@contextmanager
+def _heartbeat(doc_id: int):
+    """Keep touching ``updated_at`` while a long extraction runs.
+
+    The worker treats a ``classified`` document untouched for
+    ``worker_stale_after_seconds`` as abandoned, so a slow OCR run must not
+    look like a dead one.
+    """
+    stop = threading.Event()
+    interval = settings.worker_stale_after_seconds / 3
+
+    def beat():
+        while not stop.wait(interval):
+            db = SessionLocal()
+            try:
+                db.query(Document).filter(
+                    Document.id == doc_id, Document.status == DocumentStatus.classified,
+                ).update({"updated_at": datetime.now(timezone.utc)}, synchronize_session=False)
+                db.commit()
+            except SQLAlchemyError:
+                logger.warning("Heartbeat for document %d failed", doc_id, exc_info=True)
+            finally:
+                db.close()
+
+    thread = threading.Thread(target=beat, name=f"heartbeat-{doc_id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _record_failure(db: Session, doc_id: int, status: DocumentStatus, exc: Exception):
+    """Store the error on the document, if it still exists.
+
+    The session is rolled back first: the failed step may have left it
+    unusable (e.g. ``StaleDataError`` after the case was deleted mid-run).
+    """
+    db.rollback()
+    try:
+        db.query(Document).filter(Document.id == doc_id).update(
+            {"status": status, "error_message": str(exc)}, synchronize_session=False,
+        )
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.exception("Could not record failure for document %d", doc_id)
@@ -0,0 +1,164 @@
+"""Bulk re-classification over stored ``raw_text`` — no re-upload, no re-OCR.
+
+Jobs walk completed documents in id order, classify them in parallel batches,
+and checkpoint ``last_document_id`` after every batch so an interrupted job
+resumes where it stopped. Files are re-linked only when the category changed.
+
+Only the LLM is used: rule-based fallbacks would silently rewrite categories
+during a provider outage, so any LLM error fails the job at its checkpoint.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Case, Document, DocumentStatus, JobStatus, ReclassifyJob
+from app.services import llm
+from app.services.classifier import classify_with_llm
+from app.services.organizer import relink_document
+
+logger = logging.getLogger(__name__)
+
+
+def create_job(db: Session, case_ids: list[int]) -> ReclassifyJob:
+    """Queue a re-classification job for the given cases (empty → all).
+
+    Raises ``ValueError`` when no LLM provider is configured.
+    """
+    if not llm.is_configured():
+        raise ValueError("Re-classification requires a configured LLM provider")
+
+    job = ReclassifyJob(case_ids=",".join(str(i) for i in case_ids))
+    job.total = _documents_query(db, job).count()
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def run_job(job_id: int, max_batches: int | None = None) -> bool:
+    """Run (or resume) a job from its last checkpoint.
+
+    With ``max_batches`` the job is put back to ``pending`` after that many
+    batches so a worker can interleave other work. Returns True once the job
+    has completed or failed.
+    """
+    db = SessionLocal()
+    try:
+        job = db.query(ReclassifyJob).filter(ReclassifyJob.id == job_id).first()
+        if not job or job.status == JobStatus.completed:
+            return True
+        if not llm.is_configured():
+            raise ValueError("Re-classification requires a configured LLM provider")
+
+        job.status = JobStatus.running
+        job.error_message = ""
+        db.commit()
+
+        batches = 0
+        with ThreadPoolExecutor(max_workers=settings.reclassify_workers) as pool:
+            while max_batches is None or batches < max_batches:
+                batch = (
+                    _documents_query(db, job)
+                    .filter(Document.id > job.last_document_id)
+                    .order_by(Document.id)
+                    .limit(settings.reclassify_batch_size)
+                    .all()
+                )
+                if not batch:
+                    job.status = JobStatus.completed
+                    db.commit()
+                    return True
+
+                categories = list(pool.map(classify_with_llm, (row.raw_text for row in batch)))
+                for row, category in zip(batch, categories):
+                    if category == row.category:
+                        continue
+                    try:
+                        _apply_category(db, row, category)
+                    except OSError as exc:
+                        logger.warning(
+                            "Document %d: could not move file (%s), category left as %s",
+                            row.id, exc, row.category,
+                        )
+                        continue
+                    # The link already moved on disk, so record it before the next file
+                    job.changed += 1
+                    db.commit()
+
+                job.processed += len(batch)
+                job.last_document_id = batch[-1].id
+                db.commit()  # checkpoint; also refreshes updated_at as a heartbeat
+                batches += 1
+                logger.info(
+                    "Reclassify job %d: %d/%d processed, %d changed",
+                    job.id, job.processed, job.total, job.changed,
+                )
+
+        job.status = JobStatus.pending
+        db.commit()
+        return False
+
+    except Exception as exc:
+        logger.exception("Reclassify job %d failed", job_id)
+        db.rollback()
+        job = db.query(ReclassifyJob).filter(ReclassifyJob.id == job_id).first()
+        if job:
+            job.status = JobStatus.failed
+            job.error_message = str(exc)
+            db.commit()
+        return True
+    finally:
+        db.close()
+
+
+def resumable_filter():
+    """Jobs waiting to run, or ``running`` with no checkpoint for too long (crashed)."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.worker_stale_after_seconds)
+    return or_(
+        ReclassifyJob.status == JobStatus.pending,
+        and_(ReclassifyJob.status == JobStatus.running, ReclassifyJob.updated_at < cutoff),
+    )
+
+
+def job_case_ids(job: ReclassifyJob) -> list[int]:
+    return [int(i) for i in job.case_ids.split(",") if i]
+
+
+def _documents_query(db: Session, job: ReclassifyJob):
+    query = (
+        db.query(
+            Document.id,
+            Document.raw_text,
+            Document.category,
+            Document.stored_path,
+            Document.content_hash,
+            Case.name.label("case_name"),
+        )
+        .join(Case, Case.id == Document.case_id)
+        .filter(
+            Document.status == DocumentStatus.completed,
+            func.length(Document.raw_text) > 0,
+        )
+    )
+    case_ids = job_case_ids(job)
+    if case_ids:
+        query = query.filter(Document.case_id.in_(case_ids))
+    return query
+
+
+def _apply_category(db: Session, row, category: str):
+    new_path, content_hash = relink_document(
+        Path(row.stored_path), row.content_hash, row.case_name, category,
+    )
+    db.query(Document).filter(Document.id == row.id).update(
+        {"category": category, "stored_path": str(new_path), "content_hash": content_hash},
+        synchronize_session=False,
+    )
+    logger.info("Document %d: %s → %s", row.id, row.category, category)
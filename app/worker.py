@@ -0,0 +1,173 @@
+"""Extraction worker entry point: ``python -m app.worker``.
+
+Polls for pending documents and runs the Extract → Classify → Organize
+pipeline outside the API process. Between documents it advances queued
+re-classification jobs one batch at a time. Pair with ``PROCESS_MODE=worker``
+on the API so uploads are left for this worker instead of running in-process.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from app.config import settings
+from app.database import SessionLocal, init_db
+from app.models import Case, Document, DocumentStatus, JobStatus, ReclassifyJob
+from app.services.pipeline import finish_extraction, process_document
+from app.services.reclassifier import resumable_filter, run_job
+
+logger = logging.getLogger(__name__)
+
+
+def claim_next() -> tuple[int, str, Path] | None:
+    """Atomically claim the oldest pending document. Returns (id, case name, path)."""
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(Document.id, Document.stored_path, Case.name)
+            .join(Case, Case.id == Document.case_id)
+            .filter(Document.status == DocumentStatus.pending)
+            .order_by(Document.created_at)
+            .first()
+        )
+        if not row:
+            return None
+
+        # Guard against another worker claiming the same row in between
+        claimed = (
+            db.query(Document)
+            .filter(Document.id == row.id, Document.status == DocumentStatus.pending)
+            .update({"status": DocumentStatus.processing}, synchronize_session=False)
+        )
+        db.commit()
+        if not claimed:
+            return None
+        return row.id, row.name, Path(row.stored_path)
+    finally:
+        db.close()
+
+
+def requeue_stale() -> int:
+    """Return documents stuck in ``processing`` (e.g. after a worker crash) to the queue."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.worker_stale_after_seconds)
+    db = SessionLocal()
+    try:
+        count = (
+            db.query(Document)
+            .filter(Document.status == DocumentStatus.processing, Document.updated_at < cutoff)
+            .update({"status": DocumentStatus.pending}, synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+    if count:
+        logger.warning("Requeued %d stale processing document(s)", count)
+    return count
+
+
+def claim_unfinished() -> int | None:
+    """Claim a ``classified`` document whose remaining-page extraction was abandoned.
+
+    Documents whose extraction failed with an error (``error_message`` set)
+    are not retried.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.worker_stale_after_seconds)
+    stale = (
+        Document.status == DocumentStatus.classified,
+        Document.error_message == "",
+        Document.updated_at < cutoff,
+    )
+    db = SessionLocal()
+    try:
+        row = db.query(Document.id).filter(*stale).order_by(Document.updated_at).first()
+        if row is None:
+            return None
+
+        # Bumping updated_at makes the row fresh again for other workers
+        claimed = (
+            db.query(Document)
+            .filter(Document.id == row.id, *stale)
+            .update({"updated_at": datetime.now(timezone.utc)}, synchronize_session=False)
+        )
+        db.commit()
+        return row.id if claimed else None
+    finally:
+        db.close()
+
+
+def claim_next_job() -> int | None:
+    """Atomically claim the oldest pending (or abandoned) re-classification job."""
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(ReclassifyJob.id)
+            .filter(resumable_filter())
+            .order_by(ReclassifyJob.created_at)
+            .first()
+        )
+        if row is None:
+            return None
+
+        # Claiming bumps updated_at, so a second worker's stale check fails
+        claimed = (
+            db.query(ReclassifyJob)
+            .filter(ReclassifyJob.id == row.id, resumable_filter())
+            .update({"status": JobStatus.running}, synchronize_session=False)
+        )
+        db.commit()
+        return row.id if claimed else None
+    finally:
+        db.close()
+
+
+def run(poll_interval: float | None = None):
+    """Process pending documents until interrupted."""
+    interval = poll_interval or settings.worker_poll_interval_seconds
+    logger.info("Extraction worker started (poll every %.1fs)", interval)
+    while True:
+        try:
+            if _run_once():
+                continue
+        except Exception:
+            # Keep the worker alive through e.g. "database is locked"
+            logger.exception("Worker iteration failed")
+        time.sleep(interval)
+
+
+def _run_once() -> bool:
+    """Handle one unit of work. Returns False when there was nothing to do."""
+    job = claim_next()
+    if job is not None:
+        process_document(*job)
+        return True
+
+    doc_id = claim_unfinished()
+    if doc_id is not None:
+        finish_extraction(doc_id)
+        return True
+
+    job_id = claim_next_job()
+    if job_id is not None:
+        # One batch, then back to the queue so uploads are not starved
+        run_job(job_id, max_batches=1)
+        return True
+
+    return requeue_stale() > 0
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
+    )
+    if settings.create_schema_on_startup:
+        init_db()
+    try:
+        run()
+    except KeyboardInterrupt:
+        logger.info("Extraction worker stopped")
+
+
+if __name__ == "__main__":
+    main()
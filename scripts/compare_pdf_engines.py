@@ -0,0 +1,67 @@
+"""Compare native PDF text engines on throughput and output parity.
+
+Runs every engine in ``app.services.ocr.PDF_ENGINES`` over the same corpus and
+reports pages/second plus word-level similarity against the reference engine:
+
+    python scripts/compare_pdf_engines.py path/to/pdfs/
+    python scripts/compare_pdf_engines.py path/to/pdfs/ --reference pdfplumber --workers 4
+"""
+
+import argparse
+import difflib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import settings  # noqa: E402
+from app.services.ocr import PDF_ENGINES, extract_pdf_pages  # noqa: E402
+
+
+def similarity(a: str, b: str) -> float:
+    """Word-sequence similarity in [0, 1], insensitive to whitespace/layout."""
+    return difflib.SequenceMatcher(None, a.split(), b.split(), autojunk=False).ratio()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", type=Path, help="directory of PDFs (searched recursively)")
+    parser.add_argument("--reference", default="pdfplumber", choices=list(PDF_ENGINES))
+    parser.add_argument("--workers", type=int, default=1, help="PDF_EXTRACT_WORKERS to use")
+    args = parser.parse_args()
+
+    files = sorted(args.corpus.rglob("*.pdf"))
+    if not files:
+        sys.exit(f"No PDFs under {args.corpus}")
+    settings.pdf_extract_workers = args.workers
+
+    outputs: dict[str, dict[Path, str]] = {}
+    print(f"{len(files)} PDFs, {args.workers} worker(s)\n")
+    print(f"{'engine':<12} {'pages':>7} {'seconds':>9} {'pages/s':>9}")
+    for engine in PDF_ENGINES:
+        outputs[engine] = {}
+        pages = 0
+        started = time.perf_counter()
+        for path in files:
+            pages_text, page_count = extract_pdf_pages(path, engine)
+            outputs[engine][path] = "\n\n".join(pages_text)
+            pages += page_count
+        elapsed = time.perf_counter() - started
+        print(f"{engine:<12} {pages:>7} {elapsed:>9.2f} {pages / max(elapsed, 1e-9):>9.1f}")
+
+    print(f"\nParity vs {args.reference} (word-sequence similarity)")
+    reference = outputs[args.reference]
+    for engine, texts in outputs.items():
+        if engine == args.reference:
+            continue
+        scores = [similarity(reference[p], texts[p]) for p in files]
+        worst = min(zip(scores, files))
+        print(
+            f"{engine:<12} mean {sum(scores) / len(scores):.3f}  "
+            f"min {worst[0]:.3f} ({worst[1].name})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Local fake OpenAI-compatible provider for exercising the LLM rate limiter.
+
+Serves ``POST /chat/completions`` and throttles like a real provider: a fixed
+fraction of requests gets ``429`` with ``Retry-After`` and another fraction
+gets ``503``. Point the app at it with:
+
+    python scripts/fake_llm_server.py --port 8765 --throttle 0.2
+    LLM_PROVIDER=openai OPENAI_API_KEY=fake LLM_BASE_URL=http://127.0.0.1:8765 \\
+        python -m app.worker
+"""
+
+import argparse
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(throttle: float, error_rate: float, latency: float, reply: str):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("content-length", 0))
+            self.rfile.read(length)
+            time.sleep(latency)
+
+            roll = random.random()
+            if roll < throttle:
+                return self._send(429, {"error": {"message": "rate limited"}}, {"Retry-After": "1"})
+            if roll < throttle + error_rate:
+                return self._send(503, {"error": {"message": "overloaded"}})
+
+            self._send(200, {
+                "id": "fake",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": "fake",
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": reply},
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            })
+
+        def _send(self, status: int, body: dict, headers: dict | None = None):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, fmt, *args):
+            print(f"{self.command} {self.path} {args[1] if len(args) > 1 else ''}")
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--throttle", type=float, default=0.2, help="fraction of 429s")
+    parser.add_argument("--errors", type=float, default=0.05, help="fraction of 503s")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per request")
+    parser.add_argument("--reply", default="Other")
+    args = parser.parse_args()
+
+    handler = make_handler(args.throttle, args.errors, args.latency, args.reply)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    print(f"Fake LLM provider on http://127.0.0.1:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measure cold import time of the API and worker entry points.
+
+Runs each import in a fresh interpreter with ``-X importtime`` and reports the
+total plus the slowest top-level packages, failing when a budget is exceeded:
+
+    python scripts/import_time.py
+    python scripts/import_time.py --budget-ms 800
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+TARGETS = {
+    "api": "app.main",
+    "worker": "app.worker",
+}
+
+# Libraries that must stay out of the API import path
+HEAVY_MODULES = ("pdfplumber", "pypdfium2", "pytesseract", "pdf2image", "PIL")
+
+
+def measure(module: str | None) -> tuple[float, dict[str, float], set[str]]:
+    """Import ``module`` in a subprocess. Returns (total ms, ms per package, modules).
+
+    ``module=None`` measures bare interpreter startup, used as the baseline.
+    """
+    code = f"import {module}" if module else "pass"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    per_package: dict[str, float] = defaultdict(float)
+    imported: set[str] = set()
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len("import time:"):].split("|")
+        name = raw_name.strip()
+        imported.add(name)
+        per_package[name.split(".")[0]] += int(self_us) / 1000
+        # Nested imports are indented; top-level ones sum to the total
+        if not raw_name.startswith("  "):
+            total_us += int(cumulative_us)
+    return total_us / 1000, dict(per_package), imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=0, help="fail above this total")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline_ms, baseline_packages, _ = measure(None)
+    print(f"interpreter startup baseline: {baseline_ms:8.1f} ms (subtracted below)")
+
+    failed = False
+    for profile, module in TARGETS.items():
+        total_ms, per_package, imported = measure(module)
+        total_ms -= baseline_ms
+        for name, ms in baseline_packages.items():
+            per_package[name] = per_package.get(name, 0) - ms
+        print(f"{profile:<8} import {module}: {total_ms:8.1f} ms")
+        for name, ms in sorted(per_package.items(), key=lambda kv: -kv[1])[: args.top]:
+            print(f"           {name:<24} {ms:8.1f} ms")
+
+        heavy = sorted(m for m in HEAVY_MODULES if m in imported)
+        if profile == "api" and heavy:
+            print(f"           heavy modules imported: {', '.join(heavy)}")
+            failed = True
+        if args.budget_ms and total_ms > args.budget_ms:
+            print(f"           over budget ({args.budget_ms:.0f} ms)")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -66,6 +66,7 @@ function renderMain() {
         ${c.description ? `<div class="case-header-desc">${esc(c.description)}</div>` : ""}
       </div>
       <div class="case-header-actions">
+        <a class="btn btn-secondary btn-sm" href="${API}/cases/${c.id}/export" download>Export ZIP</a>
         <button class="btn btn-danger btn-sm" onclick="deleteCase(${c.id})">Delete Case</button>
       </div>
     </div>
@@ -290,7 +291,10 @@ async function handleUpload(event) {
 async function generateDraft(type) {
   if (!activeCase) return;
 
-  const completedDocs = documents.filter((d) => d.status === "completed");
+  // "classified" documents are usable while their remaining pages extract
+  const completedDocs = documents.filter(
+    (d) => d.status === "completed" || d.status === "classified"
+  );
   if (completedDocs.length === 0) {
     toast("No completed documents to generate from", "error");
     return;
@@ -393,8 +397,12 @@ function startPolling() {
   pollTimer = setInterval(async () => {
     if (!activeCase) return stopPolling();
 
+    // A "classified" document with an error has stopped extracting
     const hasPending = documents.some(
-      (d) => d.status === "pending" || d.status === "processing"
+      (d) =>
+        d.status === "pending" ||
+        d.status === "processing" ||
+        (d.status === "classified" && !d.error_message)
     );
     if (!hasPending) return stopPolling();
 
@@ -431,6 +439,7 @@ function statusIcon(status) {
   const icons = {
     pending: "&#9711;",
     processing: "&#8987;",
+    classified: "&#9998;",
     completed: "&#10003;",
     failed: "&#10007;",
   };